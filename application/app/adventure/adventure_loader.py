@@ -1,11 +1,63 @@
+import bisect
 import json
 import os
+import threading
+import orjson
 from typing import List
 from domain.adventure import Adventure
 from domain.map import Map, Area
 
+ADVENTURES_JSON_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), "static", "adventures.json"
+)
+
 class AdventureLoader():
 
+    # Adventures parsed from the default file, only reloaded when its modification time changes.
+    # Replaced by a new dict on reload, never updated in place, so a caller keeps a consistent snapshot.
+    _cache = {}
+    _reload_lock = threading.Lock()
+
+    @staticmethod
+    def load_default_adventures() -> dict:
+        """
+        Load the default adventures file, reusing the previous result while the file is unchanged.
+        The file is opened and parsed once per change, even by concurrent callers; callers needing
+        the raw JSON share this result. Each call returns one consistent snapshot, left untouched by
+        later reloads. Blocking on a cache miss: call it through run_in_threadpool from async handlers.
+        
+        Returns:
+            Dict holding the file modification time under "mtime", the parsed JSON list under "raw",
+            the Adventure list under "adventures", an id index under "by_id", and the adventures
+            as (file position, adventure) pairs sorted by minimum players under "by_min_players",
+            along with their "min_players_keys" for bisection
+        """
+        mtime = os.stat(ADVENTURES_JSON_PATH).st_mtime
+        cache = AdventureLoader._cache
+        if cache.get("mtime") == mtime:
+            return cache
+
+        with AdventureLoader._reload_lock:
+            # Another thread may have reloaded the file while this one was waiting
+            cache = AdventureLoader._cache
+            if cache.get("mtime") == mtime:
+                return cache
+
+            with open(ADVENTURES_JSON_PATH, 'rb') as file:
+                adventures_data = orjson.loads(file.read())
+            adventures = AdventureLoader.parse_adventures(adventures_data)
+            by_min_players = sorted(enumerate(adventures), key=lambda entry: entry[1].minPlayers)
+            cache = {
+                "mtime": mtime,
+                "raw": adventures_data,
+                "adventures": adventures,
+                "by_id": {adventure.id: adventure for adventure in adventures},
+                "by_min_players": by_min_players,
+                "min_players_keys": [adventure.minPlayers for _, adventure in by_min_players],
+            }
+            AdventureLoader._cache = cache
+        return cache
+
     @staticmethod
     def load_adventures_from_json(file_path: str) -> List[Adventure]:
         """
@@ -35,6 +87,19 @@ class AdventureLoader():
         except json.JSONDecodeError as e:
             raise json.JSONDecodeError(f"Invalid JSON in adventures file: {e}")
         
+        return AdventureLoader.parse_adventures(adventures_data)
+
+    @staticmethod
+    def parse_adventures(adventures_data: List[dict]) -> List[Adventure]:
+        """
+        Convert parsed adventures JSON data to Adventure objects.
+        
+        Args:
+            adventures_data: List of adventure dicts, as found in the adventures JSON file
+            
+        Returns:
+            List of Adventure objects, skipping the adventures that could not be processed
+        """
         adventures = []
         
         for adventure_data in adventures_data:
@@ -120,7 +185,7 @@ class AdventureLoader():
             Adventure object if found, None otherwise
         """
         if adventures is None:
-            adventures = AdventureLoader.load_adventures_from_json("static/adventures.json")
+            return AdventureLoader.load_default_adventures()["by_id"].get(adventure_id)
         
         for adventure in adventures:
             if adventure.id == adventure_id:
@@ -142,7 +207,15 @@ class AdventureLoader():
             List of compatible Adventure objects
         """
         if adventures is None:
-            adventures = AdventureLoader.load_adventures_from_json("static/adventures.json")
+            # Only adventures whose minimum fits under max_players can overlap: bisect to that prefix,
+            # then put the matches back in file order, as returned for an explicit list
+            cache = AdventureLoader.load_default_adventures()
+            end = bisect.bisect_right(cache["min_players_keys"], max_players)
+            matches = sorted(
+                (entry for entry in cache["by_min_players"][:end] if min_players <= entry[1].maxPlayers),
+                key=lambda entry: entry[0]
+            )
+            return [adventure for _, adventure in matches]
         
         compatible_adventures = []
         
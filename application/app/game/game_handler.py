@@ -1,128 +1,163 @@
-import json
+import asyncio
+import logging
 from typing import Dict
-import uuid
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
+from application.app.story_manager import StoryManager
 from domain.lobby import Lobby
 
+logger = logging.getLogger(__name__)
+
+# Successful ready_toggled replies only differ by the new state: serialize both once.
+_READY_TOGGLED_MESSAGES = {
+    is_ready: orjson.dumps({"type": "ready_toggled", "success": True, "is_ready": is_ready}).decode()
+    for is_ready in (True, False)
+}
+
 class GameHandler:
     """
     Handles all game-related logic and message processing.
     This class is responsible for managing the game state, processing player actions,
-    and coordinating game progression.
+    and coordinating game progression. It is shared by every lobby: the state of a game
+    is kept on its lobby's game_state.
     """
+    def __init__(self):
+        # Client message type -> coroutine handling it, called with (websocket, lobby, message).
+        self._message_handlers = {
+            "toggle_ready": self._handle_toggle_ready,
+            "start_adventure": self._handle_start_adventure,
+            "submit_choice": self._handle_submit_choice,
+        }
+
     async def handle_client_message(self, websocket: WebSocket, lobby: Lobby, data: str):
         """
         Handles incoming messages from a client and dispatches them to the correct handler.
         """
         try:
-            message = json.loads(data)
-            message_type = message.get("type")
-
-            if message_type == "toggle_ready":
-                new_ready_state = await self.switch_client_ready_state(websocket, lobby)
-                await websocket.send_json({
-                    "type": "ready_toggled",
-                    "success": new_ready_state is not None,
-                    "is_ready": new_ready_state
-                })
-
-            elif message_type == "start_adventure":
-                await self.start_game(lobby)
-                await self.start_new_round(lobby)
-
-            elif message_type == "submit_choice":
-                await self.submit_choice(lobby, websocket, message)
+            message = orjson.loads(data)
+            handler = self._message_handlers.get(message.get("type"))
 
+            if handler:
+                await handler(websocket, lobby, message)
             else:
                 # Handle unknown or default message types gracefully.
                 response_message = f"Server received your message: '{data}'"
                 await websocket.send_text(response_message)
-                print(f"Sent response to client in '{lobby.id}': '{response_message}'")
+                logger.debug("Sent response to client in '%s': '%s'", lobby.id, response_message)
         
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             response_message = f"Server received non-JSON message: '{data}'"
             await websocket.send_text(response_message)
-            print(f"Sent response to client in '{lobby.id}': {response_message}")
-        except Exception as e:
+            logger.debug("Sent response to client in '%s': %s", lobby.id, response_message)
+        except Exception:
             # This catch-all is for unexpected errors in message processing.
-            print(f"An error occurred while processing message in lobby '{lobby.id}': {e}")
+            logger.exception("An error occurred while processing message in lobby '%s'", lobby.id)
+
+    async def _handle_toggle_ready(self, websocket: WebSocket, lobby: Lobby, message: dict):
+        """Toggle the sender's ready state and confirm the new state to them"""
+        connection = lobby.connections.get(websocket)
+        new_ready_state = lobby.toggle_ready(connection) if connection is not None else None
+        reply = _READY_TOGGLED_MESSAGES.get(new_ready_state)
+        if reply is None:
+            reply = orjson.dumps({
+                "type": "ready_toggled",
+                "success": False,
+                "is_ready": new_ready_state
+            }).decode()
+        await websocket.send_text(reply)
+
+    async def _handle_start_adventure(self, websocket: WebSocket, lobby: Lobby, message: dict):
+        """Start the game and its first round"""
+        await self.start_game(lobby)
+        await self.start_new_round(lobby)
+
+    async def _handle_submit_choice(self, websocket: WebSocket, lobby: Lobby, message: dict):
+        """Record the sender's choice for the current round"""
+        await self.submit_choice(lobby, websocket, message)
 
     async def start_game(self, lobby: Lobby):
         """Start the game in a given lobby"""
-        all_players_ready = all(connection.is_ready for connection in lobby.connections)
-        if not all_players_ready:
+        if not lobby.all_ready():
             raise Exception("All players must be ready")
 
         lobby.game_state.started = True
+        lobby.mark_changed()
 
-        for connection in lobby.connections:
-            self.game_manager.game_state.chapters[connection.id] = []
-            message = {
-                "type": "start_adventure",
-                "info": {
-                    "success": True,
-                }
+        # Every player gets the same message: serialize it once.
+        message = orjson.dumps({
+            "type": "start_adventure",
+            "info": {
+                "success": True,
             }
+        }).decode()
+        for connection in lobby.connections.values():
+            lobby.game_state.chapters[connection.id] = []
             try:
-                await connection.socket.send_json(message)
+                await connection.socket.send_text(message)
             except WebSocketDisconnect:
                 raise
 
     async def submit_choice(self, lobby: Lobby, sender: WebSocket, choice: int):
         """Handle player choice submission"""
-        sender_connection = self._get_connection_by_socket(lobby, sender)
+        sender_connection = lobby.connections.get(sender)
         if not sender_connection:
             return
 
-        sender_uuid = uuid.UUID(sender_connection.id)
+        sender_uuid = sender_connection.id
+        chapters = lobby.game_state.chapters
         
-        if sender_uuid in self.game_state.chapters and self.game_state.chapters[sender_uuid]:
-            latest_chapter = self.game_state.chapters[sender_uuid][-1]
+        if sender_uuid in chapters and chapters[sender_uuid]:
+            latest_chapter = chapters[sender_uuid][-1]
             latest_chapter.choice = choice["choice_index"]
 
         if self._are_all_choices_made(lobby):
             await self.start_new_round(lobby)
 
-        print(f"Lobby '{lobby.id}': {sender_connection.user.name} submitted choice: {choice}")
+        logger.debug("Lobby '%s': %s submitted choice: %s", lobby.id, sender_connection.user.name, choice)
 
     async def start_new_round(self, lobby: Lobby):
         """Start a new round, and send a message to inform all players"""
-        if not self.game_manager.game_state.adventure:
-            print(f"[ERROR] No adventure set for lobby {lobby.id}")
+        if not lobby.adventure:
+            logger.error("No adventure set for lobby %s", lobby.id)
             return
 
-        self.game_state.round += 1
+        game_state = lobby.game_state
+        game_state.round += 1
+        lobby.mark_changed()
 
-        for player_id, chapters in self.game_state.chapters.items():
-
-            new_chapter = await self.story_manager.generate_chapter(
+        # Generate every player's chapter concurrently: the requests share the same
+        # prefix, so the provider can batch them instead of serving them one by one.
+        story_manager = StoryManager(lobby.adventure)
+        players_chapters = list(game_state.chapters.values())
+        new_chapters = await asyncio.gather(*(
+            story_manager.generate_chapter(
                 player_name="Jean",
                 previous_chapters=None,
                 last_choice=None
-            )
-            
+            ) for _ in players_chapters
+        ))
+
+        for chapters, new_chapter in zip(players_chapters, new_chapters):
             chapters.append(new_chapter)
 
-        for connection in lobby.connections:
+        for connection in lobby.connections.values():
             message = {
                 "type": "new_round",
                 "info": {
-                    "round_index": self.game_manager.game_state.round,
-                    "text": self.game_manager.game_state.chapters[connection.id][-1].text,
-                    "choices": self.game_manager.game_state.chapters[connection.id][-1].possiblities,
+                    "round_index": game_state.round,
+                    "text": game_state.chapters[connection.id][-1].text,
+                    "choices": game_state.chapters[connection.id][-1].possiblities,
                 }
             }
             try:
-                await connection.socket.send_json(message)
+                await connection.socket.send_text(orjson.dumps(message).decode())
             except Exception as e:
-                print(f"[ERROR] Error sending message to {connection.user.name}: {e}")
+                logger.error("Error sending message to %s: %s", connection.user.name, e)
 
     def _are_all_choices_made(self, lobby: Lobby) -> bool:
         """Check if all players in the lobby have made their choices."""
-        for connection in lobby.connections:
-            connection_uuid = uuid.UUID(connection.id)
-            if (connection_uuid not in self.game_manager.game_state.chapters or
-                not self.game_manager.game_state.chapters[connection_uuid] or
-                self.game_manager.game_state.chapters[connection_uuid][-1].choice == -1):
-                return False
-        return True
+        chapters = lobby.game_state.chapters
+        return all(
+            chapters.get(connection.id) and chapters[connection.id][-1].choice != -1
+            for connection in lobby.connections.values()
+        )
@@ -1,13 +1,36 @@
+import asyncio
 import os
 import httpx
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 
+# Upper bound on in-flight completions shared by every client, so that a burst of
+# rounds across many lobbies does not exceed the provider rate limits.
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "32"))
+
 class OpenRouterClient:
     """Client for making LLM calls through OpenRouter API"""
-    
+
+    _semaphore: Optional[asyncio.Semaphore] = None
+
+    @classmethod
+    def _get_semaphore(cls) -> asyncio.Semaphore:
+        if cls._semaphore is None:
+            cls._semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+        return cls._semaphore
+
     async def chat_completion(self) -> str:
         """
         Returns a dummy response.
         """
-        return "Dummy response."
\ No newline at end of file
+        async with self._get_semaphore():
+            return "Dummy response."
+
+_shared_client: Optional[OpenRouterClient] = None
+
+def get_llm_client() -> OpenRouterClient:
+    """Returns the process-wide OpenRouterClient, creating it on first use."""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = OpenRouterClient()
+    return _shared_client
@@ -73,9 +73,7 @@ class LobbiesManager:
         if lobby.is_full():
             raise LobbyIsFullException(lobby_id)
         
-        lobby.connections.append(
-            Connection(socket=socket, user=User(f"Player"))
-        )
+        lobby.add_connection(Connection(socket=socket, user=User(f"Player")))
         self.logger.info(f"Client {socket} successfully connected to lobby '{lobby_id}'. Total connections: {len(lobby.connections)}.")
 
     async def disconnect(self, socket: WebSocket, lobby_id: str):
@@ -83,12 +81,9 @@ class LobbiesManager:
         if lobby_id in self.lobbies.keys():
             lobby = self.lobbies[lobby_id]
             
-            for connection in lobby.connections:
-                if connection.socket == socket:
-                    lobby.connections.remove(connection)
-                    self.logger.info(f"Client {socket} removed from lobby '{lobby_id}'. Total clients: {len(lobby.connections)}")
-                    await self.broadcast_lobby_info(lobby_id)
-                    break
+            if lobby.remove_connection(socket) is not None:
+                self.logger.info(f"Client {socket} removed from lobby '{lobby_id}'. Total clients: {len(lobby.connections)}")
+                await self.broadcast_lobby_info(lobby_id)
                 
             if not lobby.connections:
                 del self.lobbies[lobby_id]
@@ -99,19 +94,13 @@ class LobbiesManager:
         if not lobby:
             return
         
-        message = {
-            "type" : "lobby_info",
-            "lobby" : lobby.to_dict()
-        }
-
-        connections = lobby.connections.copy()
-        for connection in connections:
-            try:
-                await connection.socket.send_json(message)
-            except WebSocketDisconnect:
+        # Serialized once per lobby state for every recipient, and sent to all of them concurrently.
+        failures = await lobby.broadcast(lobby.to_info_message())
+        for connection, error in failures:
+            if isinstance(error, WebSocketDisconnect):
                 await self.disconnect(connection.socket, lobby_id)
-            except Exception as e:
-                self.logger.error(f"Error broadcasting to {connection.socket}: {e}")
+            else:
+                self.logger.error(f"Error broadcasting to {connection.socket}: {error}")
 
     def _get_connection_by_socket(self, lobby_id: str, socket: WebSocket):
         """
@@ -119,10 +108,9 @@ class LobbiesManager:
         
         :raises ConnectionNotFoundException: If no matching connection is found.
         """
-        lobby = self.get_lobby(lobby_id)
-        for connection in lobby.connections:
-            if connection.socket == socket:
-                return connection
+        connection = self.get_lobby(lobby_id).connections.get(socket)
+        if connection is not None:
+            return connection
         raise ConnectionNotFoundException(f"Connection not found for socket in lobby '{lobby_id}'.")
 
     async def switch_client_ready_state(self, websocket: WebSocket, lobby_id: str) -> bool:
@@ -131,7 +119,7 @@ class LobbiesManager:
         if not connection:
             return None
             
-        connection.is_ready = not connection.is_ready
+        self.get_lobby(lobby_id).toggle_ready(connection)
         self.logger.info(f"Player '{connection.user.name}' in lobby '{lobby_id}' toggled ready state to: {connection.is_ready}")
         return connection.is_ready
 
@@ -1,8 +1,11 @@
+import logging
 from typing import List, Dict, Any
-from application.app.llm_client import OpenRouterClient
+from application.app.llm_client import get_llm_client
 from domain.chapter import Chapter
 from domain.adventure import Adventure
 
+logger = logging.getLogger(__name__)
+
 
 class StoryManager:
     """
@@ -12,7 +15,7 @@ class StoryManager:
     
     def __init__(self, adventure : Adventure):
         self.adventure = adventure
-        self.llm_client = OpenRouterClient()
+        self.llm_client = get_llm_client()
 
     async def generate_chapter(
         self, 
@@ -26,13 +29,13 @@ class StoryManager:
         Returns:
             Default Chapter object
         """
-        print(f"[STORY] Generating chapter for {player_name}")
+        logger.debug("Generating chapter for %s", player_name)
         
         chapter = Chapter(
-            self.llm_client.chat_completion(),
+            await self.llm_client.chat_completion(),
             possiblities=["choice 1", "choice 2", "choice 3"],
             choice=None
         )
         
-        print(f"[STORY] Generated chapter for {player_name}: {len(chapter.text)} chars, {len(chapter.possiblities)} choices")
+        logger.debug("Generated chapter for %s: %d chars, %d choices", player_name, len(chapter.text), len(chapter.possiblities))
         return chapter
@@ -1,67 +1,98 @@
-from application.app.adventure.adventure_loader import AdventureLoader
-from fastapi import APIRouter, HTTPException
-import json
+from application.app.adventure.adventure_loader import ADVENTURES_JSON_PATH, AdventureLoader
+from fastapi import APIRouter, HTTPException, Request, Response
+from starlette.concurrency import run_in_threadpool
+import hashlib
+import orjson
 import os
 
 router = APIRouter()
 
+# Response bodies derived from the loader's parsed adventures, rebuilt when the file changes.
+_ADV_CACHE = {}
+
+def _is_not_modified(request: Request, etag: str) -> bool:
+    """
+    Check whether the client already holds the current version of the adventures.
+    If-None-Match uses weak comparison: a W/ prefix is ignored (proxies compressing the response
+    weaken the ETag), and "*" matches any version.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+async def _load_adventures_cached() -> dict:
+    """
+    Return the adventures cache, rebuilding it only if the file changed since the last load.
+    The file itself is read through AdventureLoader, so it is parsed once for both the routes
+    and the game logic. The cache holds the adventures list, with image URLs, under "data",
+    an id index under "by_id" and the ETag of the payload under "etag". The JSON response bodies
+    are serialized once per load into "payload_bytes" (the full list) and "by_id_bytes" (one per adventure).
+    """
+    mtime = os.stat(ADVENTURES_JSON_PATH).st_mtime
+    if _ADV_CACHE.get("mtime") == mtime:
+        return _ADV_CACHE
+
+    loaded = await run_in_threadpool(AdventureLoader.load_default_adventures)
+
+    # Add full image URLs once per load rather than per request, on copies so the loader's data stays untouched
+    adventures = [dict(adventure) for adventure in loaded["raw"]]
+    for adventure in adventures:
+        if adventure.get("image"):
+            adventure["image_url"] = f"/static/images/adventures/{adventure['image']}"
+        else:
+            adventure["image_url"] = None
+
+    payload_bytes = orjson.dumps({"adventures": adventures})
+    _ADV_CACHE.update(
+        mtime=loaded["mtime"],
+        etag=f'"{hashlib.blake2b(payload_bytes, digest_size=8).hexdigest()}"',
+        data=adventures,
+        by_id={adventure["id"]: adventure for adventure in adventures},
+        payload_bytes=payload_bytes,
+        by_id_bytes={adventure["id"]: orjson.dumps(adventure) for adventure in adventures},
+    )
+    return _ADV_CACHE
+
 @router.get("/")
-async def get_adventures():
+async def get_adventures(request: Request):
     """
     Get all available adventures with their cover images.
-    Returns a JSON array of adventures with image URLs.
+    Returns a JSON array of adventures with image URLs, or 304 if the client's ETag is current.
     """
     try:
-        # Load raw JSON data for image handling
-        json_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "static/adventures.json")
-        
-        with open(json_path, 'r', encoding='utf-8') as file:
-            adventures = json.load(file)
-        
-        # Add full image URLs to each adventure
-        for adventure in adventures:
-            if adventure.get("image"):
-                # Convert relative path to full URL
-                adventure["image_url"] = f"/static/images/adventures/{adventure['image']}"
-            else:
-                adventure["image_url"] = None
-        
-        return {"adventures": adventures}
+        cache = await _load_adventures_cached()
+        if _is_not_modified(request, cache["etag"]):
+            return Response(status_code=304, headers={"ETag": cache["etag"]})
+
+        return Response(content=cache["payload_bytes"], media_type="application/json", headers={"ETag": cache["etag"]})
         
     except FileNotFoundError:
         raise HTTPException(status_code=500, detail="Adventures file not found")
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         raise HTTPException(status_code=500, detail="Invalid JSON format in adventures file")
 
 @router.get("/{adventure_id}")
-async def get_adventure_by_id_endpoint(adventure_id: int):
+async def get_adventure_by_id_endpoint(adventure_id: int, request: Request):
     """
     Get a specific adventure by its ID with image URL.
     """
     try:
-        # Load raw JSON data for image handling
-        json_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "adventures.json")
+        cache = await _load_adventures_cached()
+        adventure_bytes = cache["by_id_bytes"].get(adventure_id)
         
-        with open(json_path, 'r', encoding='utf-8') as file:
-            adventures = json.load(file)
-        
-        # Find the specific adventure
-        adventure = next((adv for adv in adventures if adv["id"] == adventure_id), None)
-        
-        if not adventure:
+        if not adventure_bytes:
             raise HTTPException(status_code=404, detail="Adventure not found")
         
-        # Add image URL
-        if adventure.get("image"):
-            adventure["image_url"] = f"/static/images/adventures/{adventure['image']}"
-        else:
-            adventure["image_url"] = None
-        
-        return adventure
+        if _is_not_modified(request, cache["etag"]):
+            return Response(status_code=304, headers={"ETag": cache["etag"]})
+
+        return Response(content=adventure_bytes, media_type="application/json", headers={"ETag": cache["etag"]})
         
     except FileNotFoundError:
         raise HTTPException(status_code=500, detail="Adventures file not found")
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         raise HTTPException(status_code=500, detail="Invalid JSON format in adventures file")
     except HTTPException:
         raise
@@ -74,10 +105,12 @@ async def get_adventure_object_by_id(adventure_id: int):
     Get a specific adventure as a fully parsed Adventure object (useful for game logic).
     """
     try:
-        adventure = AdventureLoader().get_adventure_by_id(adventure_id)
+        # Warms the loader cache off the event loop on a miss, so the lookup below stays a dict access
+        await _load_adventures_cached()
+        adventure = AdventureLoader.get_adventure_by_id(adventure_id)
         if not adventure:
             raise HTTPException(status_code=404, detail="Adventure not found")
-        return adventure.to_dict()
+        return Response(content=orjson.dumps(adventure.to_dict()), media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
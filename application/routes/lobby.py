@@ -1,6 +1,8 @@
 from application.app.adventure.adventure_exceptions import AdventureNotFoundException
 from application.app.lobby.lobby_exceptions import LobbyIsFullException, LobbyNotFound
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi import APIRouter, Depends, Response, WebSocket, WebSocketDisconnect, HTTPException
+import anyio
+import orjson
 import traceback
 import logging
 from application.app.lobby.lobbies_manager import LobbiesManager
@@ -9,8 +11,15 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 lobby_manager = LobbiesManager()
 
+def get_lobby_manager() -> LobbiesManager:
+    """
+    Dependency providing the lobbies manager shared by every request.
+    Tests override it through app.dependency_overrides to get an isolated manager.
+    """
+    return lobby_manager
+
 @router.post("/create")
-async def create_lobby_endpoint(max_players: int, adventure_id : int):
+async def create_lobby_endpoint(max_players: int, adventure_id : int, lobby_manager: LobbiesManager = Depends(get_lobby_manager)):
     """
     An HTTP endpoint to create a new lobby and return its ID.
     """
@@ -28,7 +37,7 @@ async def create_lobby_endpoint(max_players: int, adventure_id : int):
     return {"lobby_id": lobby_id}
 
 @router.get("/")
-async def get_all_lobbies():
+async def get_all_lobbies(lobby_manager: LobbiesManager = Depends(get_lobby_manager)):
     """
     Get information about all existing lobbies.
     Returns a list of lobbies with their current status, players, and game state.
@@ -37,13 +46,13 @@ async def get_all_lobbies():
         logger.debug("Retrieving all lobbies")
         result = lobby_manager.get_all_lobbies()
         logger.debug(f"Found {result['total_lobbies']} lobbies")
-        return result
+        return Response(content=orjson.dumps(result), media_type="application/json")
     except Exception as e:
         logger.error(f"Failed to retrieve lobbies: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to retrieve lobbies: {str(e)}")
 
 @router.get("/{lobby_id}")
-async def get_lobby_info(lobby_id: str):
+async def get_lobby_info(lobby_id: str, lobby_manager: LobbiesManager = Depends(get_lobby_manager)):
     """
     Get detailed information about a specific lobby.
     """
@@ -51,13 +60,22 @@ async def get_lobby_info(lobby_id: str):
     try:
         lobby = lobby_manager.get_lobby(lobby_id)
         logger.debug(f"Found lobby {lobby_id} with {len(lobby.connections)} players")
-        return lobby.to_dict()
+        return Response(content=lobby.to_json(), media_type="application/json")
     except LobbyNotFound as e:
         logger.warning(f"Lobby not found: {e}")
         raise HTTPException(status_code=404, detail=str(e))
     
+async def _disconnect(lobby_manager: LobbiesManager, websocket: WebSocket, lobby_id: str):
+    """
+    Remove a client from its lobby and notify the remaining players.
+    Shielded from cancellation: the server may cancel the connection's task right after
+    the client leaves, and the broadcast to the other players must still complete.
+    """
+    with anyio.CancelScope(shield=True):
+        await lobby_manager.disconnect(websocket, lobby_id)
+
 @router.websocket("/join/{lobby_id}")
-async def join_lobby(websocket: WebSocket, lobby_id: str):
+async def join_lobby(websocket: WebSocket, lobby_id: str, lobby_manager: LobbiesManager = Depends(get_lobby_manager)):
     """
     The main WebSocket endpoint for clients to connect to a specific lobby.
     """
@@ -76,7 +94,7 @@ async def join_lobby(websocket: WebSocket, lobby_id: str):
         await websocket.close(code=1008, reason=str(e))
 
     except WebSocketDisconnect:
-        await lobby_manager.disconnect(websocket, lobby_id)
+        # Removal from the lobby is done once, by the cleanup in the finally block.
         logger.info(f"Client disconnected from lobby '{lobby_id}'.")
     
     except Exception as e:
@@ -88,6 +106,6 @@ async def join_lobby(websocket: WebSocket, lobby_id: str):
     finally:
         logger.debug(f"Cleaning up connection for lobby '{lobby_id}'.")
         try:
-            await lobby_manager.disconnect(websocket, lobby_id)
+            await _disconnect(lobby_manager, websocket, lobby_id)
         except Exception as e:
             logger.error(f"Error during final cleanup: {e}")
\ No newline at end of file
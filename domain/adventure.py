@@ -1,11 +1,12 @@
 from domain.map import Area, Map
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-@dataclass
+@dataclass(slots=True)
 class Adventure:
     """
     Class that store an adventure.
+    Read-only once loaded, like its map: to_dict() returns a shared cached dict that callers must not mutate.
     """
     id: int
     title: str
@@ -13,13 +14,18 @@ class Adventure:
     minPlayers: int
     maxPlayers: int
     map: Map
+    _dict_cache: dict | None = field(default=None, init=False, repr=False, compare=False)
     
     def to_dict(self):
-        return {
-            'id': self.id,
-            'title': self.title,
-            'description': self.description,
-            'minPlayers': self.minPlayers,
-            'maxPlayers': self.maxPlayers,
-            'map': self.map.to_dict()
-        }
\ No newline at end of file
+        # Map.to_dict returns the same object until the map changes, so reuse ours until then
+        map_dict = self.map.to_dict()
+        if self._dict_cache is None or self._dict_cache['map'] is not map_dict:
+            self._dict_cache = {
+                'id': self.id,
+                'title': self.title,
+                'description': self.description,
+                'minPlayers': self.minPlayers,
+                'maxPlayers': self.maxPlayers,
+                'map': map_dict
+            }
+        return self._dict_cache
\ No newline at end of file
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-@dataclass
+@dataclass(slots=True)
 class Chapter:
     """Represents a within a story with a te ."""
     text: str
@@ -7,10 +7,11 @@ class Chapter:
     choice: int | None = -1
 
     def to_dict(self):
+        possiblities = list(self.possiblities)
         return {
             "text": self.text,
-            "possiblities": [possiblity for possiblity in self.possiblities],
-            "results": [possiblity for possiblity in self.possiblities],
+            "possiblities": possiblities,
+            "results": possiblities,
             "choice": self.choice
         }
     
\ No newline at end of file
@@ -5,7 +5,7 @@ from fastapi import WebSocket
 
 from domain.user import User
 
-@dataclass
+@dataclass(slots=True)
 class Connection:
     """
         Represents a websocket connection to a lobby.
@@ -14,11 +14,16 @@ class Connection:
     socket: WebSocket
     user: User
     is_ready: bool = False
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: uuid.UUID = field(default_factory=uuid.uuid4)
+
+    @property
+    def id_str(self) -> str:
+        """The connection id as sent to clients"""
+        return str(self.id)
 
     def to_dict(self):
         return {
-            "id": self.id,
+            "id": self.id_str,
             "user": self.user.to_dict(),
             "is_ready": self.is_ready,
         }
@@ -3,7 +3,7 @@ import uuid
 from domain.adventure import Adventure
 from domain.chapter import Chapter
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     """Represents the current state of a running game."""
     started: bool = False
@@ -1,37 +1,118 @@
-from typing import Set, List
+import asyncio
+from typing import Dict, Optional
 from dataclasses import dataclass, field
+import orjson
 from domain.adventure import Adventure
 from domain.connection import Connection
 from domain.game_state import GameState
 from fastapi import WebSocket
 
-@dataclass
+# Sends gathered at once by Lobby.broadcast; larger lobbies are sent to in batches of this size,
+# yielding to the event loop in between so other connections are not starved.
+BROADCAST_BATCH_SIZE = 50
+
+@dataclass(slots=True)
 class Lobby:
     """Represents a single lobby with player limits and connections."""
     id: str
     max_players: int
     adventure: Adventure
     game_state: GameState = field(default_factory=GameState)
-    connections: List[Connection] = field(default_factory=list)
-    host: WebSocket = None
+    # Key is the client's socket. Filled through add_connection/remove_connection only, which keep ready_count in sync
+    connections: Dict[WebSocket, Connection] = field(default_factory=dict, init=False)
+    host: Optional[WebSocket] = None
+    ready_count: int = field(default=0, init=False, compare=False)  # kept in sync by the connection methods below
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    _json_cache: tuple[int, bytes] | None = field(default=None, init=False, repr=False, compare=False)
+    _info_message_cache: tuple[int, str] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def mark_changed(self):
+        """Invalidate the cached serialization. Call after any change to the lobby state."""
+        self._version += 1
+
+    def to_json(self) -> bytes:
+        """Return the lobby as JSON bytes, serialized at most once per state version."""
+        if self._json_cache is None or self._json_cache[0] != self._version:
+            self._json_cache = (self._version, orjson.dumps(self.to_dict()))
+        return self._json_cache[1]
+
+    def to_info_message(self) -> str:
+        """Return the "lobby_info" WebSocket frame sent to the players, built at most once per state version."""
+        if self._info_message_cache is None or self._info_message_cache[0] != self._version:
+            frame = b'{"type":"lobby_info","lobby":' + self.to_json() + b'}'
+            self._info_message_cache = (self._version, frame.decode())
+        return self._info_message_cache[1]
+
+    async def broadcast(self, payload: str) -> list[tuple[Connection, Exception]]:
+        """
+        Send a text frame to every connection concurrently, so a slow client does not delay the others.
+        Connections are sent to in batches of BROADCAST_BATCH_SIZE, yielding to the event loop between batches.
+        The payload must be serialized by the caller, once for all recipients.
+        Returns the connections whose send failed, along with the raised exception.
+        """
+        if not isinstance(payload, str):
+            raise TypeError(f"Lobby.broadcast expects a serialized str payload, got {type(payload).__name__}")
+        connections = list(self.connections.values())
+        failures = []
+        for start in range(0, len(connections), BROADCAST_BATCH_SIZE):
+            if start:
+                await asyncio.sleep(0)
+            batch = connections[start:start + BROADCAST_BATCH_SIZE]
+            results = await asyncio.gather(
+                *(connection.socket.send_text(payload) for connection in batch),
+                return_exceptions=True
+            )
+            failures.extend(
+                (connection, result) for connection, result in zip(batch, results)
+                if isinstance(result, Exception)
+            )
+        return failures
+
+    def add_connection(self, connection: Connection):
+        """Add a client connection to the lobby."""
+        self.connections[connection.socket] = connection
+        if connection.is_ready:
+            self.ready_count += 1
+        self.mark_changed()
+
+    def remove_connection(self, socket: WebSocket) -> Optional[Connection]:
+        """Remove the connection of a client socket. Returns it, or None if the socket is not in the lobby."""
+        connection = self.connections.pop(socket, None)
+        if connection is not None:
+            if connection.is_ready:
+                self.ready_count -= 1
+            self.mark_changed()
+        return connection
+
+    def toggle_ready(self, connection: Connection) -> bool:
+        """Switch the ready state of a connection of the lobby. Returns the new state."""
+        connection.is_ready = not connection.is_ready
+        self.ready_count += 1 if connection.is_ready else -1
+        self.mark_changed()
+        return connection.is_ready
+
+    def all_ready(self) -> bool:
+        return self.ready_count == len(self.connections)
 
     def is_full(self):
         return len(self.connections) >= self.max_players
 
     def to_dict(self):
+        current_players = len(self.connections)
+        adventure = self.adventure
         return {
             "id": self.id,
             "max_players": self.max_players,
-            "current_players": len(self.connections),
-            "adventure_title": self.adventure.title if self.adventure else None,
-            "adventure_description": self.adventure.description if self.adventure else None,
+            "current_players": current_players,
+            "adventure_title": adventure.title if adventure else None,
+            "adventure_description": adventure.description if adventure else None,
             "game_started": self.game_state.started,
             "current_round": self.game_state.round,
             "players": [
                 {
                     "name": conn.user.name,
                     "is_ready": conn.is_ready
-                } for conn in self.connections
+                } for conn in self.connections.values()
             ],
-            "is_full": len(self.connections) >= self.max_players
+            "is_full": current_players >= self.max_players
         }
\ No newline at end of file
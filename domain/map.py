@@ -1,4 +1,5 @@
 class Area:
+    __slots__ = ("id", "name", "description")
     
     def __init__(self, id: int, name: str, description: str = ""):
         self.id = id
@@ -6,13 +7,21 @@ class Area:
         self.description = description
 
 class Map:
+    """
+    Areas of an adventure and the connections between them.
+    Read-only once loaded, except through the methods below, which reset the cached to_dict():
+    the areas, the connection sets and the to_dict() result are shared, not copied, so callers must not mutate them.
+    """
+    __slots__ = ("id", "areas", "connections", "_dict_cache")
     
     def __init__(self, id: int, areas: list[Area], connections: dict[int, set[int]] = None):
         self.id = id
         self.areas = areas
         self.connections = connections or {}
+        self._dict_cache = None  # serialized form, reset by every mutator
     
     def add_connection(self, area_id_one: int, area_id_two: int):
+        self._dict_cache = None
         if area_id_one not in self.connections: self.connections[area_id_one] = set()
         if area_id_two not in self.connections: self.connections[area_id_two] = set()
         
@@ -23,6 +32,7 @@ class Map:
         return self.connections.get(area_id, set())
     
     def remove_connection(self, area_id_one: int, area_id_two: int):
+        self._dict_cache = None
         if area_id_one in self.connections:
             self.connections[area_id_one].discard(area_id_two)
         if area_id_two in self.connections:
@@ -40,10 +50,12 @@ class Map:
         return self.areas.copy()
     
     def add_area(self, area: Area):
+        self._dict_cache = None
         self.areas.append(area)
     
     def remove_area(self, area_id: int):
         if 0 <= area_id < len(self.areas):
+            self._dict_cache = None
             for connected_id in list(self.connections.get(area_id, set())):
                 self.remove_connection(area_id, connected_id)
             
@@ -68,6 +80,9 @@ class Map:
                 area.id -= 1
     
     def to_dict(self) -> dict:
+        if self._dict_cache is not None:
+            return self._dict_cache
+
         area_id_map = {}
         for i, area in enumerate(self.areas):
             area_id_map[i] = f"area_{i}"
@@ -85,10 +100,11 @@ class Map:
                 "connections": connected_keys
             }
         
-        return {
+        self._dict_cache = {
             "id": self.id,
             "areas": areas_dict
         }
+        return self._dict_cache
 
     @staticmethod
     def load(map_data) -> "Map":
@@ -1,11 +1,10 @@
 from dataclasses import dataclass
 from fastapi import WebSocket
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """Represents a User and its informations."""
-    def __init__(self, name: str):
-        self.name = name
+    name: str
 
     def to_dict(self):
         return {"name": self.name}
@@ -0,0 +1,68 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from unittest.mock import patch
+
+from application.app.adventure.adventure_loader import ADVENTURES_JSON_PATH, AdventureLoader
+import pytest
+
+@pytest.fixture(autouse=True)
+def clean_loader_cache(monkeypatch):
+    """Start every test with an empty adventures cache"""
+    monkeypatch.setattr(AdventureLoader, "_cache", {})
+
+def test_get_adventure_by_id_success():
+    """Test that an adventure from the default file can be retrieved by its ID."""
+    adventure = AdventureLoader.get_adventure_by_id(1)
+    
+    assert adventure is not None
+    assert adventure.id == 1
+
+def test_get_adventure_by_id_returns_none_for_unknown_id():
+    """Test that None is returned for an adventure ID that does not exist."""
+    assert AdventureLoader.get_adventure_by_id(999) is None
+
+def test_default_adventures_are_parsed_once():
+    """Test that the default file is not parsed again while it is unchanged."""
+    with patch.object(AdventureLoader, "parse_adventures", wraps=AdventureLoader.parse_adventures) as load:
+        first = AdventureLoader.get_adventure_by_id(1)
+        second = AdventureLoader.get_adventure_by_id(1)
+    
+    assert load.call_count == 1
+    assert first is second
+
+def test_reload_leaves_previous_snapshot_untouched():
+    """Test that a reload replaces the cache instead of changing the dict earlier callers hold."""
+    first = AdventureLoader.load_default_adventures()
+    snapshot = dict(first)
+    
+    AdventureLoader._cache = {**first, "mtime": None}
+    second = AdventureLoader.load_default_adventures()
+    
+    assert second is not first
+    assert first == snapshot
+    assert second["adventures"] is not first["adventures"]
+
+def test_concurrent_cold_loads_parse_once():
+    """Test that threads loading a cold cache at the same time parse the file once."""
+    start = threading.Barrier(4)
+    
+    def load():
+        start.wait()
+        return AdventureLoader.load_default_adventures()
+    
+    with patch.object(AdventureLoader, "parse_adventures", wraps=AdventureLoader.parse_adventures) as parse:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: load(), range(4)))
+    
+    assert parse.call_count == 1
+    assert all(result is results[0] for result in results)
+
+def test_get_adventures_by_player_count_matches_linear_filter():
+    """Test that the indexed lookup returns the same adventures, in the same order, as filtering the full list."""
+    all_adventures = AdventureLoader.load_adventures_from_json(ADVENTURES_JSON_PATH)
+    
+    for min_players, max_players in [(1, 1), (2, 2), (3, 5), (5, 8), (1, 10)]:
+        indexed = AdventureLoader.get_adventures_by_player_count(min_players, max_players)
+        linear = AdventureLoader.get_adventures_by_player_count(min_players, max_players, all_adventures)
+        
+        assert [a.id for a in indexed] == [a.id for a in linear]
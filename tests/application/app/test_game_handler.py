@@ -0,0 +1,76 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+from application.app.game.game_handler import GameHandler
+from application.app.lobby.lobbies_manager import LobbiesManager
+from application.app.llm_client import OpenRouterClient
+from domain.adventure import Adventure
+from domain.connection import Connection
+from domain.lobby import Lobby
+from domain.user import User
+import orjson
+import pytest
+
+PLAYERS = 16
+GENERATION_DELAY = 0.01
+
+@pytest.fixture
+def slow_completions(monkeypatch):
+    """LLM completions taking GENERATION_DELAY each, like a real provider call"""
+    async def slow_chat_completion(self):
+        await asyncio.sleep(GENERATION_DELAY)
+        return "text"
+
+    monkeypatch.setattr(OpenRouterClient, "chat_completion", slow_chat_completion)
+
+async def test_start_adventure_generates_chapters_concurrently(slow_completions):
+    """Test that chapters are generated for all players at once rather than one after another."""
+    handler = LobbiesManager().game_handler
+    lobby = Lobby("lobby", max_players=PLAYERS, adventure=Adventure(1, "title", "description", 1, PLAYERS, None))
+    sockets = [Mock(send_text=AsyncMock()) for _ in range(PLAYERS)]
+    for i, socket in enumerate(sockets):
+        connection = Connection(socket, User(f"player {i}"))
+        lobby.add_connection(connection)
+        lobby.toggle_ready(connection)
+
+    # Sequential generation would take PLAYERS * GENERATION_DELAY
+    await asyncio.wait_for(
+        handler.handle_client_message(sockets[0], lobby, '{"type": "start_adventure"}'),
+        timeout=GENERATION_DELAY * PLAYERS / 2
+    )
+
+    assert lobby.game_state.started
+    assert lobby.game_state.round == 1
+    assert all(len(chapters) == 1 for chapters in lobby.game_state.chapters.values())
+    for socket in sockets:
+        new_round = orjson.loads(socket.send_text.await_args.args[0])
+        assert new_round["type"] == "new_round"
+        assert new_round["info"]["text"] == "text"
+
+async def test_toggle_ready_replies_with_new_state():
+    """Test that the sender's ready state is switched in the lobby and sent back to them."""
+    handler = GameHandler()
+    websocket = Mock(send_text=AsyncMock())
+    lobby = Lobby("lobby", max_players=PLAYERS, adventure=None)
+    lobby.add_connection(Connection(websocket, User("player")))
+
+    await handler.handle_client_message(websocket, lobby, '{"type": "toggle_ready"}')
+    await handler.handle_client_message(websocket, lobby, '{"type": "toggle_ready"}')
+
+    replies = [orjson.loads(call.args[0]) for call in websocket.send_text.await_args_list]
+    assert replies == [
+        {"type": "ready_toggled", "success": True, "is_ready": True},
+        {"type": "ready_toggled", "success": True, "is_ready": False},
+    ]
+    assert lobby.ready_count == 0
+
+async def test_toggle_ready_from_outside_the_lobby_fails():
+    """Test that a socket without a connection in the lobby is told the toggle failed."""
+    handler = GameHandler()
+    websocket = Mock(send_text=AsyncMock())
+    lobby = Lobby("lobby", max_players=PLAYERS, adventure=None)
+
+    await handler.handle_client_message(websocket, lobby, '{"type": "toggle_ready"}')
+
+    websocket.send_text.assert_awaited_once()
+    assert orjson.loads(websocket.send_text.await_args.args[0]) == {"type": "ready_toggled", "success": False, "is_ready": None}
@@ -5,8 +5,10 @@ from domain.adventure import Adventure
 from domain.connection import Connection
 from domain.lobby import Lobby
 from domain.user import User
+import json
 import pytest
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 from starlette.websockets import WebSocketDisconnect
 
 # --- Mocks for Dependencies ---
@@ -16,32 +18,24 @@ class MockAdventure:
         self.id = adventure_id
         self.title = title
 
+# Stand-in for lobbies whose adventure is only read when serializing them
+FAKE_ADVENTURE = SimpleNamespace(id=1, title="adventure", description="description")
+
 class MockWebSocket:
     async def accept(self):
         pass
     async def send_json(self, message):
         pass
-
-class MockConnection:
-    def __init__(self, websocket):
-        self.socket = websocket
+    async def send_text(self, message):
+        pass
 
 # --- Fixtures for Tests ---
 
-@pytest.fixture
-def mock_adventure_loader():
-    """
-    Mocks the AdventureLoader class to control its behavior in tests.
-    We are patching the entire class and defining the behavior of its static methods.
-    """
-    with patch('application.app.adventure.adventure_loader.AdventureLoader') as MockedAdventureLoader:
-        mock_adventure = MockAdventure(adventure_id=1, title="The Lost Treasure")
-        
-        MockedAdventureLoader.get_adventure_by_id.return_value = mock_adventure
-        MockedAdventureLoader.load_adventures_from_json.return_value = [mock_adventure]
-        
-        yield MockedAdventureLoader
-        
+@pytest.fixture(scope="module")
+def adventure():
+    """Adventure shared by the lobbies of this module, which never modify it."""
+    return Adventure(1, "adventure", "description", 1, 4, None)
+
 @pytest.fixture
 def lobbies_manager():
     """Fixture to create a clean LobbiesManager instance for each test."""
@@ -103,8 +97,8 @@ def test_get_all_lobbies_success(lobbies_manager):
     """Test that get_all_lobbies returns correct information for multiple lobbies."""
     lobby1_id = "lobby_1"
     lobby2_id = "lobby_2"
-    lobbies_manager.lobbies[lobby1_id] = Lobby(lobby1_id, max_players=4, adventure=Mock())
-    lobbies_manager.lobbies[lobby2_id] = Lobby(lobby2_id, max_players=2, adventure=Mock())
+    lobbies_manager.lobbies[lobby1_id] = Lobby(lobby1_id, max_players=4, adventure=FAKE_ADVENTURE)
+    lobbies_manager.lobbies[lobby2_id] = Lobby(lobby2_id, max_players=2, adventure=FAKE_ADVENTURE)
 
     lobbies_data = lobbies_manager.get_all_lobbies()
 
@@ -126,7 +120,6 @@ def test_get_all_lobbies_empty(lobbies_manager):
 
 # --- Unit tests for connect method ---
 
-@pytest.mark.asyncio
 async def test_connect_success(lobbies_manager):
     """
     Test a successful connection to an existing, non-full lobby.
@@ -139,9 +132,8 @@ async def test_connect_success(lobbies_manager):
     await lobbies_manager.connect(mock_websocket, lobby_id)
 
     assert len(lobby.connections) == 1
-    assert lobby.connections[0].socket == mock_websocket
+    assert lobby.connections[mock_websocket].socket == mock_websocket
 
-@pytest.mark.asyncio
 async def test_connect_raises_lobby_not_found(lobbies_manager):
     """
     Test that connecting to a non-existent lobby raises LobbyNotFound.
@@ -152,72 +144,41 @@ async def test_connect_raises_lobby_not_found(lobbies_manager):
     with pytest.raises(LobbyNotFound, match=non_existent_id):
         await lobbies_manager.connect(mock_websocket, non_existent_id)
 
-@pytest.mark.asyncio
-async def test_connect_raises_lobby_is_full(lobbies_manager):
+async def test_connect_raises_lobby_is_full(lobbies_manager, monkeypatch):
     """
     Test that connecting to a full lobby raises LobbyIsFullException.
     """
     full_lobby_id = "full_lobby"
-    with patch("domain.lobby.Lobby.is_full",return_value=True):
-        lobby = Lobby(full_lobby_id, max_players=2, adventure=Mock(1, "adventure"))
-        lobbies_manager.lobbies[full_lobby_id] = lobby
-        mock_websocket = MockWebSocket()
-        
-        with pytest.raises(LobbyIsFullException, match=full_lobby_id):
-            await lobbies_manager.connect(mock_websocket, full_lobby_id)
+    monkeypatch.setattr(Lobby, "is_full", lambda self: True)
+    lobby = Lobby(full_lobby_id, max_players=2, adventure=MockAdventure(1, "adventure"))
+    lobbies_manager.lobbies[full_lobby_id] = lobby
+    mock_websocket = MockWebSocket()
+    
+    with pytest.raises(LobbyIsFullException, match=full_lobby_id):
+        await lobbies_manager.connect(mock_websocket, full_lobby_id)
 
 # --- Unit Tests for disconnect method ---
 
-@pytest.mark.asyncio
-async def test_disconnect_success_with_multiple_clients(lobbies_manager):
-    """Test that a client is successfully disconnected and the lobby remains."""
-    lobby_id = "test_lobby_multi"
-    lobby = Lobby(lobby_id, max_players=4, adventure=Adventure(1, "adventure", "description", 1, 2, None))
-    
-    socket1 = MockWebSocket()
-    socket2 = MockWebSocket()
-    lobby.connections.append(Connection(socket1, Mock()))
-    lobby.connections.append(Connection(socket2, Mock()))
-    lobbies_manager.lobbies[lobby_id] = lobby
-    
-    await lobbies_manager.disconnect(socket1, lobby_id)
-    assert len(lobby.connections) == 1
-    assert lobby.connections[0].socket == socket2
-    assert lobby_id in lobbies_manager.lobbies
-
-@pytest.mark.asyncio
-async def test_disconnect_last_client_removes_lobby(lobbies_manager):
-    """Test that disconnecting the last client removes the lobby."""
-    lobby_id = "test_lobby_single"
-    lobby = Lobby(lobby_id, max_players=4, adventure=Adventure(1, "adventure", "description", 1, 2, None))
-    
-    socket1 = MockWebSocket()
-    lobby.connections.append(MockConnection(socket1))
-    lobbies_manager.lobbies[lobby_id] = lobby
-    
-    await lobbies_manager.disconnect(socket1, lobby_id)
-    
-    assert lobby_id not in lobbies_manager.lobbies
-    assert not lobby.connections
-
-@pytest.mark.asyncio
-async def test_disconnect_non_existent_client_leaves_others_untouched(lobbies_manager):
-    """Test that attempting to disconnect a non-existent client does not affect others."""
-    lobby_id = "test_lobby_non_existent_client"
-    lobby = Lobby(lobby_id, max_players=4, adventure=Adventure(1, "adventure", "description", 1, 2, None))
+@pytest.mark.parametrize("connected, leaving, remaining", [
+    (["socket1", "socket2"], "socket1", ["socket2"]),
+    (["socket1"], "socket1", []),
+    (["socket1"], "non_existent_socket", ["socket1"]),
+], ids=["multiple_clients", "last_client_removes_lobby", "non_existent_client_leaves_others_untouched"])
+async def test_disconnect(lobbies_manager, adventure, connected, leaving, remaining):
+    """Test that only the leaving client is disconnected, and that the lobby is removed once empty."""
+    lobby_id = "test_lobby"
+    lobby = Lobby(lobby_id, max_players=4, adventure=adventure)
     
-    socket1 = MockWebSocket()
-    lobby.connections.append(MockConnection(socket1))
+    sockets = {name: MockWebSocket() for name in connected + [leaving]}
+    for name in connected:
+        lobby.add_connection(Connection(sockets[name], User(name)))
     lobbies_manager.lobbies[lobby_id] = lobby
     
-    non_existent_socket = MockWebSocket()
-    await lobbies_manager.disconnect(non_existent_socket, lobby_id)
+    await lobbies_manager.disconnect(sockets[leaving], lobby_id)
     
-    assert len(lobby.connections) == 1
-    assert lobby.connections[0].socket == socket1
-    assert lobby_id in lobbies_manager.lobbies
+    assert list(lobby.connections) == [sockets[name] for name in remaining]
+    assert (lobby_id in lobbies_manager.lobbies) == bool(remaining)
 
-@pytest.mark.asyncio
 async def test_disconnect_from_non_existent_lobby_does_nothing(lobbies_manager):
     """Test that attempting to disconnect from a non-existent lobby does not raise an error."""
     non_existent_id = "non_existent_lobby"
@@ -228,70 +189,69 @@ async def test_disconnect_from_non_existent_lobby_does_nothing(lobbies_manager):
 
 # --- Unit Tests for broadcast_lobby_info method ---
 
-@pytest.mark.asyncio
-async def test_broadcast_lobby_info_success(lobbies_manager):
+# lobby_info message expected by test_broadcast_lobby_info_success
+EXPECTED_BROADCAST = {
+    'type': 'lobby_info',
+    'lobby': {
+        "id": "broadcast_test_lobby",
+        "max_players": 4,
+        "current_players": 2,
+        "adventure_title": "adventure",
+        "adventure_description": "description",
+        "game_started": False,
+        "current_round": 0,
+        "players": [
+            {
+                "name": "name1",
+                "is_ready": False
+            },
+            {
+                "name": "name2",
+                "is_ready": True
+            },
+        ],
+        "is_full": False
+    }
+}
+
+async def test_broadcast_lobby_info_success(lobbies_manager, adventure):
     """Test that broadcasting lobby info successfully sends a message to all clients."""
     lobby_id = "broadcast_test_lobby"
-    lobby = Lobby(lobby_id, max_players=4, adventure=Adventure(1, "adventure", "description", 2, 4, None))
+    lobby = Lobby(lobby_id, max_players=4, adventure=adventure)
     
-    socket1 = Mock(spec=MockWebSocket)
-    socket2 = Mock(spec=MockWebSocket)
-    lobby.connections.append(Connection(socket1, User("name1"), False, "id1"))
-    lobby.connections.append(Connection(socket2, User("name2"), True, "id2"))
+    socket1 = AsyncMock()
+    socket2 = AsyncMock()
+    lobby.add_connection(Connection(socket1, User("name1"), is_ready=False))
+    lobby.add_connection(Connection(socket2, User("name2"), is_ready=True))
     lobbies_manager.lobbies[lobby_id] = lobby
     
     await lobbies_manager.broadcast_lobby_info(lobby_id)
     
-    expected_message = {
-        'type': 'lobby_info',
-        'lobby': {
-            "id": "broadcast_test_lobby",
-            "max_players": 4,
-            "current_players": 2,
-            "adventure_title": "adventure",
-            "adventure_description": "description",
-            "game_started": False,
-            "current_round": 0,
-            "players": [
-                {
-                    "name": "name1",
-                    "is_ready": False
-                },
-                {
-                    "name": "name2",
-                    "is_ready": True
-                },
-            ],
-            "is_full": False
-        }
-    }
-    
-    socket1.send_json.assert_called_once_with(expected_message)
-    socket1.send_json.assert_called_once_with(expected_message)
+    socket1.send_text.assert_called_once()
+    assert json.loads(socket1.send_text.call_args.args[0]) == EXPECTED_BROADCAST
+    socket2.send_text.assert_called_once()
+    assert json.loads(socket2.send_text.call_args.args[0]) == EXPECTED_BROADCAST
 
-@pytest.mark.asyncio
-async def test_broadcast_lobby_info_disconnects_client_on_websocket_disconnect(lobbies_manager):
+async def test_broadcast_lobby_info_disconnects_client_on_websocket_disconnect(lobbies_manager, adventure):
     """Test that a client is disconnected when a WebSocketDisconnect exception occurs."""
     lobby_id = "disconnect_on_broadcast"
-    lobby = Lobby(lobby_id, max_players=4, adventure=MockAdventure(1, "adventure"))
-    lobby.to_dict = Mock(return_value={"id": lobby_id, "players": 2})
+    lobby = Lobby(lobby_id, max_players=4, adventure=adventure)
 
-    mock_socket1 = Mock(spec=MockWebSocket)
-    mock_socket1.send_json.side_effect = WebSocketDisconnect
-    mock_socket2 = Mock(spec=MockWebSocket)
+    mock_socket1 = AsyncMock()
+    mock_socket1.send_text.side_effect = WebSocketDisconnect
+    mock_socket2 = AsyncMock()
     
-    lobby.connections.append(MockConnection(mock_socket1))
-    lobby.connections.append(MockConnection(mock_socket2))
+    lobby.add_connection(Connection(mock_socket1, User("name1")))
+    lobby.add_connection(Connection(mock_socket2, User("name2")))
     lobbies_manager.lobbies[lobby_id] = lobby
     
     with patch.object(lobbies_manager, "disconnect") as mock_disconnect:
         await lobbies_manager.broadcast_lobby_info(lobby_id)
         mock_disconnect.assert_called_once_with(mock_socket1, lobby_id)
-        mock_socket2.send_json.assert_called_once()
+        mock_socket2.send_text.assert_called_once()
 
 # --- Unit tests for switch_client_ready_state method ---
 
-@pytest.mark.asyncio
 async def test_switch_client_ready_state_success(lobbies_manager):
     """Test that a client's ready state is successfully toggled."""
     lobby_id = "ready_state_lobby"
@@ -302,7 +262,7 @@ async def test_switch_client_ready_state_success(lobbies_manager):
     connection = Connection(mock_socket, mock_user)
     connection.is_ready = False
     
-    lobby.connections.append(connection)
+    lobby.add_connection(connection)
     lobbies_manager.lobbies[lobby_id] = lobby
     
     result = await lobbies_manager.switch_client_ready_state(mock_socket, lobby_id)
@@ -313,7 +273,6 @@ async def test_switch_client_ready_state_success(lobbies_manager):
     assert result is False
     assert connection.is_ready is False
 
-@pytest.mark.asyncio
 async def test_switch_client_ready_state_raises_connection_not_found(lobbies_manager):
     """Test that an error is handled when the connection is not found."""
     lobby_id = "test_lobby"
@@ -325,7 +284,6 @@ async def test_switch_client_ready_state_raises_connection_not_found(lobbies_man
     with pytest.raises(ConnectionNotFoundException):
         await lobbies_manager.switch_client_ready_state(non_existent_socket, lobby_id)
 
-@pytest.mark.asyncio
 async def test_switch_client_ready_state_raises_value_error_if_lobby_not_found(lobbies_manager):
     """Test that a ValueError is handled when the lobby does not exist."""
     non_existent_id = "non_existent_id"
@@ -333,3 +291,17 @@ async def test_switch_client_ready_state_raises_value_error_if_lobby_not_found(l
     
     with pytest.raises(LobbyNotFound):
         await lobbies_manager.switch_client_ready_state(mock_socket, non_existent_id)
+
+async def test_switch_client_ready_state_refreshes_lobby_json(lobbies_manager, adventure):
+    """Test that toggling the ready state invalidates the lobby's cached serialization."""
+    lobby_id = "ready_state_json_lobby"
+    lobby = Lobby(lobby_id, max_players=4, adventure=adventure)
+    
+    mock_socket = MockWebSocket()
+    lobby.add_connection(Connection(mock_socket, User("test_user")))
+    lobbies_manager.lobbies[lobby_id] = lobby
+    assert json.loads(lobby.to_json())["players"][0]["is_ready"] is False
+    
+    await lobbies_manager.switch_client_ready_state(mock_socket, lobby_id)
+    
+    assert json.loads(lobby.to_json())["players"][0]["is_ready"] is True
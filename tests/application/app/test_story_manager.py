@@ -0,0 +1,31 @@
+import asyncio
+
+from application.app.llm_client import OpenRouterClient
+from application.app.story_manager import StoryManager
+import pytest
+
+@pytest.fixture
+def semaphore(monkeypatch):
+    """Single-slot completion semaphore, in place of the process-wide one"""
+    semaphore = asyncio.Semaphore(1)
+    monkeypatch.setattr(OpenRouterClient, "_semaphore", semaphore)
+    return semaphore
+
+async def test_generate_chapter_returns_completion_text(semaphore):
+    """Test that the chapter holds the awaited completion text."""
+    chapter = await StoryManager(adventure=None).generate_chapter(player_name="player")
+
+    assert chapter.text == "Dummy response."
+    assert len(chapter.possiblities) == 3
+
+async def test_generate_chapter_waits_for_a_free_completion_slot(semaphore):
+    """Test that chapter generation is held back while every completion slot is in use."""
+    story_manager = StoryManager(adventure=None)
+
+    async with semaphore:
+        pending = asyncio.create_task(story_manager.generate_chapter(player_name="player"))
+        await asyncio.sleep(0.01)
+        assert not pending.done()
+
+    chapter = await asyncio.wait_for(pending, timeout=1)
+    assert chapter.text == "Dummy response."
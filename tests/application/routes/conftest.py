@@ -0,0 +1,36 @@
+from fastapi.testclient import TestClient
+from main import app
+import httpx
+import pytest
+import pytest_asyncio
+
+@pytest.fixture(scope="session")
+def client():
+    """Single test client shared by every route test, so the app is started once per session"""
+    with TestClient(app) as test_client:
+        yield test_client
+
+@pytest.fixture
+def websocket_connection(client):
+    """Fixture to manage WebSocket connections and ensure they're closed after each test"""
+    active_connections = []
+    
+    def _create_connection(path):
+        ws = client.websocket_connect(path)
+        active_connections.append(ws)
+        return ws
+    
+    yield _create_connection
+    
+    # Clean up all connections after the test
+    for ws in active_connections:
+        try:
+            ws.close()
+        except Exception:
+            pass  # Connection might already be closed
+
+@pytest_asyncio.fixture
+async def async_client():
+    """Async client calling the app in-process, for tests that run on the event loop"""
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as test_client:
+        yield test_client
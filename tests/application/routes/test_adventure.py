@@ -0,0 +1,91 @@
+from unittest.mock import patch
+
+from application.app.adventure.adventure_loader import AdventureLoader
+from application.routes import adventure
+import pytest
+
+# --- fixtures
+
+@pytest.fixture(autouse=True)
+def clean_adventures_cache(monkeypatch):
+    """Start every test with empty adventures caches"""
+    adventure._ADV_CACHE.clear()
+    monkeypatch.setattr(AdventureLoader, "_cache", {})
+    yield
+    adventure._ADV_CACHE.clear()
+
+# --- Getting all adventures
+
+async def test_get_adventures_success(async_client):
+    """Test that the endpoint returns every adventure with its image URL."""
+    response = await async_client.get("/adventures/")
+    assert response.status_code == 200
+    adventures = response.json()["adventures"]
+    assert len(adventures) > 0
+    assert adventures[0]["image_url"] == f"/static/images/adventures/{adventures[0]['image']}"
+
+async def test_get_adventures_reads_file_once(async_client):
+    """Test that the adventures file is parsed once for every route, and again only when it changes."""
+    with patch.object(AdventureLoader, "parse_adventures", wraps=AdventureLoader.parse_adventures) as parse:
+        await async_client.get("/adventures/")
+        await async_client.get("/adventures/")
+        await async_client.get("/adventures/1/object")
+        assert parse.call_count == 1
+
+        adventure._ADV_CACHE["mtime"] = None
+        AdventureLoader._cache = {}
+        await async_client.get("/adventures/")
+        assert parse.call_count == 2
+
+# --- Getting one adventure
+
+async def test_get_adventure_by_id_success(async_client):
+    """Test that the endpoint returns the requested adventure."""
+    response = await async_client.get("/adventures/1")
+    assert response.status_code == 200
+    assert response.json()["id"] == 1
+
+async def test_get_adventure_by_id_not_found(async_client):
+    """Test that the endpoint returns a 404 for a non-existent adventure."""
+    response = await async_client.get("/adventures/999")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Adventure not found"
+
+# --- Getting one adventure object
+
+async def test_get_adventure_object_uses_thread_only_on_cache_miss(async_client):
+    """Test that a warm adventure object lookup does not go through the thread pool."""
+    with patch.object(adventure, "run_in_threadpool", wraps=adventure.run_in_threadpool) as run:
+        assert (await async_client.get("/adventures/1/object")).json()["id"] == 1
+        assert (await async_client.get("/adventures/1/object")).json()["id"] == 1
+    
+    assert run.call_count == 1
+
+# --- Conditional requests
+
+async def test_get_adventures_not_modified_with_matching_etag(async_client):
+    """Test that a client sending the current ETag gets an empty 304 response."""
+    etag = (await async_client.get("/adventures/")).headers["etag"]
+    
+    response = await async_client.get("/adventures/", headers={"If-None-Match": etag})
+    
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+async def test_get_adventure_by_id_with_stale_etag_returns_body(async_client):
+    """Test that a client sending an outdated ETag gets the full adventure."""
+    response = await async_client.get("/adventures/1", headers={"If-None-Match": '"stale"'})
+    
+    assert response.status_code == 200
+    assert response.json()["id"] == 1
+    assert "etag" in response.headers
+
+@pytest.mark.parametrize("if_none_match", ['W/{etag}', '"stale", {etag}', '*'], ids=["weak", "list", "wildcard"])
+async def test_get_adventures_not_modified_with_weakly_matching_etag(async_client, if_none_match):
+    """Test that If-None-Match uses weak comparison and accepts the "*" wildcard."""
+    etag = (await async_client.get("/adventures/")).headers["etag"]
+    
+    response = await async_client.get("/adventures/", headers={"If-None-Match": if_none_match.format(etag=etag)})
+    
+    assert response.status_code == 304
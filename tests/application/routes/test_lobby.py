@@ -1,62 +1,46 @@
+import asyncio
 from unittest.mock import patch
 
-from application.routes.lobby import lobby_manager
+from application.app.adventure.adventure_loader import AdventureLoader
+from application.app.lobby.lobbies_manager import LobbiesManager
+from application.routes.lobby import get_lobby_manager
 from domain.adventure import Adventure
 from domain.lobby import Lobby
-from fastapi.testclient import TestClient
-from starlette.websockets import WebSocketDisconnect
 from main import app
+from starlette.websockets import WebSocketDisconnect
 import pytest
 
-client = TestClient(app)
+# Never mutated by the tests, so one instance is shared by every lobby and stub
+_FIXED_ADVENTURE = Adventure(1, "title", "description", 2, 4, None)
 
 # --- fixtures
 
 @pytest.fixture(autouse=True)
-def clean_lobbies():
-    """Clean up lobbies before and after each test"""
-    lobby_manager.lobbies.clear()
-    yield
-    lobby_manager.lobbies.clear()
-
-@pytest.fixture
-def websocket_connection():
-    """Fixture to manage WebSocket connections and ensure they're closed after each test"""
-    active_connections = []
-    
-    def _create_connection(path):
-        ws = client.websocket_connect(path)
-        active_connections.append(ws)
-        return ws
-    
-    yield _create_connection
-    
-    # Clean up all connections after the test
-    for ws in active_connections:
-        try:
-            ws.close()
-        except Exception:
-            pass  # Connection might already be closed
-
-@pytest.fixture
+def lobby_manager():
+    """Give each test its own lobbies manager, installed in place of the app's shared one"""
+    manager = LobbiesManager()
+    app.dependency_overrides[get_lobby_manager] = lambda: manager
+    yield manager
+    app.dependency_overrides.pop(get_lobby_manager, None)
+
+@pytest.fixture(scope="module")
 def mock_adventure():
-    """Fixture to provide a mock adventure"""
-    with patch(
-        "application.app.adventure.adventure_loader.AdventureLoader.get_adventure_by_id",
-        return_value=Adventure(1, "title", "description", 2, 4, None),
-    ) as mock:
-        yield mock
+    """Fixture to provide a mock adventure, stubbed in once for the module since it never changes"""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(AdventureLoader, "get_adventure_by_id", staticmethod(lambda adventure_id, adventures=None: _FIXED_ADVENTURE))
+        yield _FIXED_ADVENTURE
 
 @pytest.fixture
-def create_mock_lobby():
+def create_mock_lobby(request, lobby_manager):
     """
     Fixture to create and return a mock lobby with a predefined ID. 
     The lobby is added directly to the lobby_manager for testing.
+    Holds 3 players, unless another max_players is given through indirect parametrization.
     """
     mock_lobby_id = "1"
-    mock_adventure = Adventure(1, "title", "description", 2, 4, None)
+    max_players = getattr(request, "param", 3)
     
-    mock_lobby = Lobby(mock_lobby_id, 3, mock_adventure)
+    mock_lobby = Lobby(mock_lobby_id, max_players, _FIXED_ADVENTURE)
     lobby_manager.lobbies[mock_lobby_id] = mock_lobby
     
     yield mock_lobby_id
@@ -65,9 +49,9 @@ def create_mock_lobby():
 
 # --- Creating a lobby
 
-def test_create_lobby_success(mock_adventure):
+async def test_create_lobby_success(mock_adventure, async_client, lobby_manager):
     
-    response = client.post(
+    response = await async_client.post(
         "/lobbies/create",
         params={"max_players": 4, "adventure_id": 1}
     )
@@ -77,9 +61,20 @@ def test_create_lobby_success(mock_adventure):
     lobby_id = response.json()["lobby_id"]
     assert lobby_id in lobby_manager.lobbies
 
-def test_create_lobby_invalid_limits(mock_adventure):
+async def test_create_lobbies_concurrently(mock_adventure, async_client, lobby_manager):
+    """Test that concurrent creations each get their own lobby."""
+    responses = await asyncio.gather(*(
+        async_client.post("/lobbies/create", params={"max_players": 4, "adventure_id": 1})
+        for _ in range(3)
+    ))
+    
+    lobby_ids = {response.json()["lobby_id"] for response in responses}
+    assert len(lobby_ids) == 3
+    assert lobby_ids <= lobby_manager.lobbies.keys()
+
+async def test_create_lobby_invalid_limits(mock_adventure, async_client):
     """Test that a lobby cannot be created with invalid limits."""
-    response = client.post(
+    response = await async_client.post(
         "/lobbies/create",
         params={"max_players": 0, "adventure_id": 1}
     )
@@ -99,7 +94,8 @@ def test_websocket_joins_non_existent_lobby(mock_adventure, websocket_connection
     assert e.value.code == 1008
     assert "Lobby with id : 'nonexistent' was not found." in str(e.value.reason)
     
-def test_websocket_joins_lobby_successfully(create_mock_lobby, websocket_connection):
+@pytest.mark.parametrize("create_mock_lobby", [3, 4], indirect=True)
+def test_websocket_joins_lobby_successfully(create_mock_lobby, websocket_connection, lobby_manager):
     """Test that a client can connect to a lobby."""
     lobby_id = "1"
     
@@ -109,6 +105,7 @@ def test_websocket_joins_lobby_successfully(create_mock_lobby, websocket_connect
         assert lobby_info["type"] == "lobby_info"
         assert lobby_info["lobby"]["id"] == lobby_id
         assert lobby_info["lobby"]["current_players"] == 1
+        assert lobby_info["lobby"]["max_players"] == lobby_manager.lobbies[lobby_id].max_players
 
 def test_websocket_join_full_lobby(create_mock_lobby, websocket_connection):
     """Test that a connection to a full lobby fails."""
@@ -130,6 +127,7 @@ def test_websocket_join_full_lobby(create_mock_lobby, websocket_connection):
 
 # --- Broadcasting lobby info
 
+@pytest.mark.parametrize("create_mock_lobby", [3, 4], indirect=True)
 def test_websocket_broadcast_lobby_info(create_mock_lobby, websocket_connection):
     """Test that all clients receive updated lobby info when a new client joins."""
     lobby_id = create_mock_lobby
@@ -151,11 +149,40 @@ def test_websocket_broadcast_lobby_info(create_mock_lobby, websocket_connection)
             assert lobby_update["lobby"]["current_players"] == 2
             assert lobby_update["lobby"]["id"] == lobby_id
 
+def test_websocket_broadcast_serializes_lobby_once(create_mock_lobby, websocket_connection):
+    """Test that each broadcast serializes the lobby once, whatever the number of recipients."""
+    lobby_id = create_mock_lobby
+
+    with patch.object(Lobby, "to_dict", autospec=True, side_effect=Lobby.to_dict) as to_dict:
+        with websocket_connection(f"/lobbies/join/{lobby_id}") as ws1:
+            ws1.receive_json()
+            with websocket_connection(f"/lobbies/join/{lobby_id}") as ws2:
+                ws2.receive_json()
+                assert ws1.receive_json()["lobby"]["current_players"] == 2
+
+                # One serialization per join, although the second join reached two clients
+                assert to_dict.call_count == 2
+
+# --- Toggling ready state
+
+def test_websocket_toggle_ready(create_mock_lobby, websocket_connection):
+    """Test that a client toggling its ready state gets the new state, then the updated lobby info."""
+    lobby_id = create_mock_lobby
+
+    with websocket_connection(f"/lobbies/join/{lobby_id}") as ws:
+        ws.receive_json()
+        ws.send_text('{"type": "toggle_ready"}')
+
+        assert ws.receive_json() == {"type": "ready_toggled", "success": True, "is_ready": True}
+        lobby_update = ws.receive_json()
+        assert lobby_update["type"] == "lobby_info"
+        assert lobby_update["lobby"]["players"][0]["is_ready"] is True
+
 # --- Getting all lobbies info
 
-def test_get_all_lobbies_success(create_mock_lobby):
+async def test_get_all_lobbies_success(create_mock_lobby, async_client):
     """Test that the endpoint returns a list of all lobbies."""
-    response = client.get("/lobbies/")
+    response = await async_client.get("/lobbies/")
     assert response.status_code == 200
     data = response.json()
     assert "total_lobbies" in data
@@ -166,20 +193,12 @@ def test_get_all_lobbies_success(create_mock_lobby):
     assert lobby["id"] == create_mock_lobby
     assert lobby["current_players"] == 0
 
-def test_get_all_lobbies_empty():
-    """Test that the endpoint returns an empty lobby list when no lobbies exist."""
-    response = client.get("/lobbies/")
-    assert response.status_code == 200
-    data = response.json()
-    assert data["total_lobbies"] == 0
-    assert data["lobbies"] == []
-
 # --- Getting one lobby info
 
-def test_get_lobby_info_success(create_mock_lobby):
+async def test_get_lobby_info_success(create_mock_lobby, async_client):
     """Test that the endpoint returns detailed info for a specific lobby."""
     lobby_id = create_mock_lobby
-    response = client.get(f"/lobbies/{lobby_id}")
+    response = await async_client.get(f"/lobbies/{lobby_id}")
     assert response.status_code == 200
     lobby_info = response.json()
     assert lobby_info["id"] == lobby_id
@@ -190,15 +209,9 @@ def test_get_lobby_info_success(create_mock_lobby):
     assert lobby_info["adventure_title"] == "title"
     assert lobby_info["adventure_description"] == "description"
 
-def test_get_lobby_info_not_found():
-    """Test that the endpoint returns a 404 for a non-existent lobby."""
-    response = client.get("/lobbies/nonexistent")
-    assert response.status_code == 404
-    assert response.json()["detail"] == "Lobby with id : 'nonexistent' was not found."
-
 # --- Client disconnects
 
-def test_websocket_client_disconnects(create_mock_lobby, websocket_connection):
+def test_websocket_client_disconnects(create_mock_lobby, websocket_connection, lobby_manager):
     """Test that the lobby manager handles client disconnections gracefully."""
     lobby_id = create_mock_lobby
     
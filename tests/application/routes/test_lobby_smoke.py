@@ -0,0 +1,22 @@
+from application.routes.lobby import lobby_manager
+import pytest
+
+# Smoke checks needing no lobby setup, run alone with `pytest -m smoke`
+pytestmark = pytest.mark.smoke
+
+# These tests read the app's own lobbies manager: make sure it starts empty
+lobby_manager.lobbies.clear()
+
+async def test_get_all_lobbies_empty(async_client):
+    """Test that the endpoint returns an empty lobby list when no lobbies exist."""
+    response = await async_client.get("/lobbies/")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_lobbies"] == 0
+    assert data["lobbies"] == []
+
+async def test_get_lobby_info_not_found(async_client):
+    """Test that the endpoint returns a 404 for a non-existent lobby."""
+    response = await async_client.get("/lobbies/nonexistent")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Lobby with id : 'nonexistent' was not found."
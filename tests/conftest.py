@@ -1,4 +1,15 @@
 import sys
 import os
+import pytest
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
\ No newline at end of file
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on every platform (e.g. Windows): keep pytest-asyncio's default loop
+    pass
+else:
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run the async tests on uvloop, as uvicorn does in production"""
+        return {"uvloop": uvloop.new_event_loop}
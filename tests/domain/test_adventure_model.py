@@ -0,0 +1,32 @@
+from types import SimpleNamespace
+
+from domain.adventure import Adventure
+from domain.map import Area, Map
+
+def test_to_dict():
+    game_map = Map(1, [Area(0, "A", "First")])
+    adventure = Adventure(1, "Title", "Description", 2, 4, game_map)
+    
+    adventure_dict = adventure.to_dict()
+    
+    assert adventure_dict["id"] == 1
+    assert adventure_dict["minPlayers"] == 2
+    assert adventure_dict["maxPlayers"] == 4
+    assert adventure_dict["map"] is game_map.to_dict()
+
+def test_to_dict_shares_the_map_dict_and_is_rebuilt_only_when_it_changes():
+    map_dict = {"id": 1, "areas": {}}
+    game_map = SimpleNamespace(to_dict=lambda: map_dict)
+    adventure = Adventure(1, "Title", "Description", 2, 4, game_map)
+    
+    first = adventure.to_dict()
+    assert first["map"] is map_dict
+    assert adventure.to_dict() is first
+    
+    # An equal but new map dict still means the map was serialized again
+    map_dict = {"id": 1, "areas": {}}
+    updated = adventure.to_dict()
+    
+    assert updated is not first
+    assert updated["map"] is map_dict
+    assert adventure.to_dict() is updated
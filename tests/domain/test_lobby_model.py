@@ -0,0 +1,100 @@
+from domain.adventure import Adventure
+from domain.connection import Connection
+from domain import lobby as lobby_module
+from domain.lobby import BROADCAST_BATCH_SIZE, Lobby
+from domain.user import User
+import orjson
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+def make_lobby():
+    return Lobby("lobby", max_players=4, adventure=Adventure(1, "adventure", "description", 2, 4, None))
+
+def test_to_json_matches_to_dict():
+    lobby = make_lobby()
+    
+    assert orjson.loads(lobby.to_json()) == lobby.to_dict()
+
+def test_to_json_is_reused_until_marked_changed():
+    lobby = make_lobby()
+    
+    first = lobby.to_json()
+    assert lobby.to_json() is first
+    
+    lobby.add_connection(Connection(None, User("name")))
+    updated = lobby.to_json()
+    
+    assert updated is not first
+    assert orjson.loads(updated)["current_players"] == 1
+
+def test_to_info_message_wraps_lobby_and_is_reused_until_marked_changed():
+    lobby = make_lobby()
+    
+    first = lobby.to_info_message()
+    assert orjson.loads(first) == {"type": "lobby_info", "lobby": lobby.to_dict()}
+    assert lobby.to_info_message() is first
+    
+    lobby.mark_changed()
+    
+    assert lobby.to_info_message() is not first
+
+async def test_broadcast_sends_to_every_connection_and_returns_failures():
+    lobby = make_lobby()
+    ok_socket = Mock(send_text=AsyncMock())
+    error = RuntimeError("closed")
+    failing_socket = Mock(send_text=AsyncMock(side_effect=error))
+    lobby.add_connection(Connection(ok_socket, User("ok")))
+    lobby.add_connection(Connection(failing_socket, User("failing")))
+    
+    failures = await lobby.broadcast("payload")
+    
+    ok_socket.send_text.assert_awaited_once_with("payload")
+    failing_socket.send_text.assert_awaited_once_with("payload")
+    assert failures == [(lobby.connections[failing_socket], error)]
+
+async def test_broadcast_sends_to_large_lobbies_in_batches(monkeypatch):
+    lobby = make_lobby()
+    sockets = [Mock(send_text=AsyncMock()) for _ in range(BROADCAST_BATCH_SIZE * 2 + 1)]
+    error = RuntimeError("closed")
+    sockets[-1].send_text.side_effect = error
+    for i, socket in enumerate(sockets):
+        lobby.add_connection(Connection(socket, User(f"player {i}")))
+    sleep = AsyncMock()
+    monkeypatch.setattr(lobby_module.asyncio, "sleep", sleep)
+    
+    failures = await lobby.broadcast("payload")
+    
+    assert all(socket.send_text.await_count == 1 for socket in sockets)
+    assert failures == [(lobby.connections[sockets[-1]], error)]
+    # Yields to the event loop between each of the three batches
+    assert sleep.await_count == 2
+
+async def test_broadcast_rejects_unserialized_payload():
+    lobby = make_lobby()
+    
+    with pytest.raises(TypeError):
+        await lobby.broadcast({"type": "lobby_info"})
+
+def test_ready_count_follows_connections_and_toggles():
+    lobby = make_lobby()
+    ready = Connection("socket1", User("ready"), is_ready=True)
+    waiting = Connection("socket2", User("waiting"))
+    
+    lobby.add_connection(ready)
+    lobby.add_connection(waiting)
+    assert lobby.ready_count == 1
+    assert not lobby.all_ready()
+    
+    assert lobby.toggle_ready(waiting) is True
+    assert lobby.all_ready()
+    
+    lobby.remove_connection("socket1")
+    assert lobby.ready_count == 1
+    assert lobby.all_ready()
+    
+    assert lobby.toggle_ready(waiting) is False
+    assert lobby.ready_count == 0
+
+def test_connections_cannot_be_passed_to_the_constructor():
+    with pytest.raises(TypeError):
+        Lobby("lobby", 4, None, connections={"socket": Connection("socket", User("ready"), is_ready=True)})
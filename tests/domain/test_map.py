@@ -1,4 +1,3 @@
-import pytest
 from domain.map import Area, Map
 
 def test_area_creation():
@@ -148,4 +147,19 @@ def test_load_complex_map():
     assert len(corridor_connections) == 3
     assert 0 in corridor_connections
     assert 2 in corridor_connections
-    assert 3 in corridor_connections
\ No newline at end of file
+    assert 3 in corridor_connections
+
+
+def test_to_dict_is_reused_until_map_changes():
+    areas = [Area(0, "A"), Area(1, "B")]
+    game_map = Map(1, areas)
+    
+    first = game_map.to_dict()
+    assert game_map.to_dict() is first
+    
+    game_map.add_connection(0, 1)
+    updated = game_map.to_dict()
+    
+    assert updated is not first
+    assert updated["areas"]["area_0"]["connections"] == ["area_1"]
+